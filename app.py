@@ -1,62 +1,203 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import case, event, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
+import asyncio
+import atexit
+import hashlib
+import orjson
+import sqlite3
 import requests
+import redis
 import os
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from datetime import datetime, timedelta, timezone
+from uuid import uuid4
 from dotenv import load_dotenv
 import logging
-from functools import wraps
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, wraps
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
+from cachetools import TTLCache
 import validators
 import bcrypt
 import jwt
 from werkzeug.security import generate_password_hash, check_password_hash
 
+try:
+    import httpx  # optional: enables async Telegram fan-out
+except ImportError:
+    httpx = None
+
 # Load environment variables
 load_dotenv()
 
+class ORJSONProvider(JSONProvider):
+    """Rust-backed JSON serialization for every jsonify call"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 app.config['SECRET_KEY'] = os.getenv('FLASK_SECRET_KEY', 'dev-secret-key-change-in-production')
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///crypto_alerts.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# One writer, N readers: SQLite allows a single writer at a time, so the
+# default (write) pool is capped at one connection while reads go through
+# a separate read-only pool sized to the CPU count.
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': 1,
+    'max_overflow': 0,
+    'pool_pre_ping': True,
+    'connect_args': {'check_same_thread': False, 'timeout': 5}
+}
+app.config['SQLALCHEMY_BINDS'] = {
+    'reader': {
+        'url': 'sqlite:///file:crypto_alerts.db?mode=ro&uri=true',
+        'pool_size': os.cpu_count() or 4,
+        'max_overflow': 2,
+        'pool_pre_ping': True,
+        'connect_args': {'check_same_thread': False, 'timeout': 5}
+    }
+}
 
 # Initialize extensions
 db = SQLAlchemy(app)
 CORS(app)
 
+@event.listens_for(Engine, 'connect')
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune SQLite for concurrent reads while the scheduler writes.
+
+    WAL lets readers proceed during a write, synchronous=NORMAL drops the
+    per-commit fsync (safe under WAL), and busy_timeout avoids immediate
+    'database is locked' errors under contention.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute('PRAGMA journal_mode=WAL')
+    except sqlite3.OperationalError:
+        # Read-only connections can't switch the journal mode; the
+        # writer's first connection sets it and it persists in the file
+        pass
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA busy_timeout=5000')
+    cursor.execute('PRAGMA cache_size=-20000')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.close()
+
+@event.listens_for(Engine, 'checkin')
+def run_sqlite_optimize(dbapi_connection, connection_record):
+    """Keep the query planner's statistics fresh as connections recycle"""
+    if dbapi_connection is None:
+        return
+    try:
+        dbapi_connection.execute('PRAGMA optimize')
+    except sqlite3.Error:
+        # Read-only or already-closed connections can't run the analyze
+        pass
+
+def reader_session():
+    """Session on the read-only pool; writes stay on db.session"""
+    return Session(db.engines['reader'])
+
 # Security: Rate limiting
-request_counts = defaultdict(list)
 RATE_LIMIT_REQUESTS = 100  # requests per minute
 RATE_LIMIT_WINDOW = 60  # seconds
 
+# Redis-backed fixed-window counters: one INCR+EXPIRE per request, shared
+# across workers and bounded by the key TTL. Falls back to an in-process
+# window if Redis is not configured or unreachable.
+redis_client = redis.Redis(
+    connection_pool=redis.ConnectionPool.from_url(
+        os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
+        max_connections=20,
+        socket_timeout=1,
+        socket_connect_timeout=1
+    )
+)
+
+# In-process fallback state (single worker only). Timestamps are appended
+# in order, so expiring the window is a popleft from the head instead of
+# rebuilding the whole history; monotonic time is immune to NTP jumps.
+request_counts = defaultdict(deque)
+_SWEEP_EVERY = 1024  # fallback calls between opportunistic sweeps
+_fallback_calls = 0
+
+def _rate_limit_exceeded_fallback(client_ip):
+    """In-process fixed window used when Redis is unavailable"""
+    # Sweep opportunistically from the request path itself: under
+    # gunicorn only one worker hosts the scheduler, so a scheduled job
+    # would leave the other workers' maps growing during a Redis outage
+    global _fallback_calls
+    _fallback_calls += 1
+    if _fallback_calls % _SWEEP_EVERY == 0:
+        sweep_rate_limit_counts()
+
+    window = request_counts[client_ip]
+    now = time.monotonic()
+    while window and now - window[0] >= RATE_LIMIT_WINDOW:
+        window.popleft()
+    if len(window) >= RATE_LIMIT_REQUESTS:
+        return True
+    window.append(now)
+    return False
+
+def sweep_rate_limit_counts():
+    """Drop per-IP entries whose window has fully expired"""
+    now = time.monotonic()
+    for client_ip in list(request_counts):
+        window = request_counts[client_ip]
+        while window and now - window[0] >= RATE_LIMIT_WINDOW:
+            window.popleft()
+        if not window:
+            del request_counts[client_ip]
+
 def rate_limit(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
         client_ip = request.remote_addr
-        current_time = time.time()
-        
-        # Clean old requests
-        request_counts[client_ip] = [
-            req_time for req_time in request_counts[client_ip] 
-            if current_time - req_time < RATE_LIMIT_WINDOW
-        ]
-        
-        # Check rate limit
-        if len(request_counts[client_ip]) >= RATE_LIMIT_REQUESTS:
+
+        try:
+            # Atomic fixed-window check: INCR the per-IP counter and set its
+            # TTL only when the key is first created (start of the window)
+            pipe = redis_client.pipeline()
+            pipe.incr(f'ip:{client_ip}')
+            pipe.expire(f'ip:{client_ip}', RATE_LIMIT_WINDOW, nx=True)
+            count, _ = pipe.execute()
+            exceeded = count > RATE_LIMIT_REQUESTS
+        except redis.RedisError:
+            exceeded = _rate_limit_exceeded_fallback(client_ip)
+
+        if exceeded:
             return jsonify({'error': 'Rate limit exceeded'}), 429
-        
-        # Add current request
-        request_counts[client_ip].append(current_time)
-        
+
         return f(*args, **kwargs)
     return decorated_function
 
 # Database Models
 class Alert(db.Model):
+    # Composite indexes covering the scheduler scan (is_active,
+    # crypto_symbol) and the per-user listing (telegram_chat_id, is_active)
+    __table_args__ = (
+        db.Index('ix_alert_active_symbol', 'is_active', 'crypto_symbol'),
+        db.Index('ix_alert_chat_active', 'telegram_chat_id', 'is_active'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     crypto_symbol = db.Column(db.String(10), nullable=False)
     threshold_price = db.Column(db.Float, nullable=False)
@@ -108,10 +249,28 @@ class User(db.Model):
         }
 
 # Security: Input validation
+# Precompiled once so the hot request paths don't pay per-call string
+# scans; ASCII letters only, matching the supported symbol set
+_SYMBOL_RE = re.compile(r'[A-Za-z]{1,10}\Z')
+_CHAT_NUMERIC_RE = re.compile(r'-?\d+\Z')  # user, group or channel IDs
+_CHAT_USERNAME_RE = re.compile(r'@.+\Z')
+
+# Symbols and chat IDs repeat constantly (small real-world cardinality),
+# so the regex match is memoized and repeat validations become a single
+# dict hit; the type guards stay outside the cache so non-hashable
+# inputs can't blow it up
+@lru_cache(maxsize=1024)
+def _crypto_symbol_valid(symbol):
+    return bool(_SYMBOL_RE.match(symbol))
+
+@lru_cache(maxsize=1024)
+def _telegram_chat_id_valid(chat_id):
+    return bool(_CHAT_NUMERIC_RE.match(chat_id) or _CHAT_USERNAME_RE.match(chat_id))
+
 def validate_crypto_symbol(symbol):
     if not symbol or not isinstance(symbol, str):
         return False
-    return symbol.upper().isalpha() and len(symbol) <= 10
+    return _crypto_symbol_valid(symbol)
 
 def validate_price(price):
     try:
@@ -126,22 +285,13 @@ def validate_telegram_chat_id(chat_id):
     
     # Convert to string if it's a number
     chat_id = str(chat_id)
-    
+
     # Telegram chat IDs can be:
     # - Positive numbers (user chats): 123456789
     # - Negative numbers (group chats): -123456789
     # - Usernames starting with @: @username
     # - Channel IDs: -1001234567890
-    
-    # Check if it's a numeric ID (positive or negative)
-    if chat_id.lstrip('-').isdigit():
-        return True
-    
-    # Check if it's a username (starts with @)
-    if chat_id.startswith('@') and len(chat_id) > 1:
-        return True
-    
-    return False
+    return _telegram_chat_id_valid(chat_id)
 
 # Authentication utilities
 def validate_email(email):
@@ -198,6 +348,51 @@ def require_auth(f):
     
     return decorated_function
 
+# Symbol -> CoinGecko coin ID for the supported cryptocurrencies
+COIN_MAPPING = {
+    'BTC': 'bitcoin',
+    'ETH': 'ethereum',
+    'ADA': 'cardano',
+    'DOT': 'polkadot',
+    'LINK': 'chainlink',
+    'UNI': 'uniswap',
+    'AAVE': 'aave',
+    'SOL': 'solana',
+    'MATIC': 'matic-network',
+    'AVAX': 'avalanche-2'
+}
+
+# Connect timeout slightly above the TCP retransmission window, read
+# timeout matching what we already allowed per call
+HTTP_TIMEOUT = (3.05, 10)
+
+def build_http_session():
+    """Create a requests.Session with connection pooling and retries"""
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            # Only transient 5xx are retried (bounded exponential
+            # backoff, no Retry-After sleeps that could pin a worker).
+            # 429 is deliberately not in the list: retrying a throttled
+            # upstream at 0.5/1/2s just burns rate budget, so the first
+            # 429 surfaces to the caller, which backs off or propagates
+            # the upstream Retry-After to clients
+            status_forcelist=[500, 502, 503, 504],
+            respect_retry_after_header=False
+        )
+    ))
+    return session
+
+class UpstreamRateLimited(Exception):
+    """Raised when an upstream API answers 429 and asks us to back off"""
+    def __init__(self, retry_after=None):
+        super().__init__('Upstream rate limit hit')
+        self.retry_after = retry_after
+
 # Crypto API Service
 class CryptoService:
     def __init__(self):
@@ -207,9 +402,63 @@ class CryptoService:
             'X-CMC_PRO_API_KEY': self.api_key,
             'Accept': 'application/json'
         } if self.api_key else {}
-        
+        # Pooled session: reuses TCP+TLS connections to the API hosts
+        # instead of a fresh handshake per call
+        self.session = build_http_session()
+        # Short-lived caches so burst traffic and the 10s scheduler tick
+        # share upstream responses instead of each hitting the API
+        self._price_cache = TTLCache(maxsize=256, ttl=10)  # symbol -> price
+        self._chart_cache = TTLCache(maxsize=128, ttl=60)  # (symbol, days) -> payload
+        self._cache_lock = threading.Lock()
+        # Single-flight: one in-flight upstream call per symbol batch,
+        # concurrent callers for the same batch wait on its Future
+        self._inflight = {}  # sorted symbol tuple -> Future
+        self._inflight_lock = threading.Lock()
+
     def get_crypto_prices(self, symbols):
         """Get current prices for given cryptocurrency symbols"""
+        with self._cache_lock:
+            hits = {s: self._price_cache[s] for s in symbols if s in self._price_cache}
+
+        misses = [s for s in symbols if s not in hits]
+        if not misses:
+            return hits
+
+        inflight_key = tuple(sorted(misses))
+        with self._inflight_lock:
+            future = self._inflight.get(inflight_key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[inflight_key] = future
+
+        if is_owner:
+            try:
+                fetched = self._fetch_prices(misses)
+                future.set_result(fetched)
+            except Exception as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with self._inflight_lock:
+                    self._inflight.pop(inflight_key, None)
+            with self._cache_lock:
+                self._price_cache.update(fetched)
+        else:
+            # Another thread is already fetching this batch; wait for it.
+            # If the owner is stuck (e.g. riding out an upstream back-off)
+            # or its fetch failed, serve what we have rather than turning
+            # every concurrent price request into a 500.
+            try:
+                fetched = future.result(timeout=10)
+            except Exception as e:
+                app.logger.warning(f"Timed out waiting for in-flight price fetch: {e}")
+                return hits
+
+        return {**hits, **fetched}
+
+    def _fetch_prices(self, symbols):
+        """Fetch prices from the upstream API, bypassing the cache"""
         if not self.api_key or self.api_key == 'your-coinmarketcap-api-key':
             # Fallback to free API if no API key or placeholder key
             return self._get_free_crypto_prices(symbols)
@@ -222,7 +471,7 @@ class CryptoService:
                 'convert': 'USD'
             }
             
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
+            response = self.session.get(url, headers=self.headers, params=params, timeout=HTTP_TIMEOUT)
             response.raise_for_status()
             data = response.json()
             
@@ -242,34 +491,20 @@ class CryptoService:
         """Fallback free API for crypto prices"""
         prices = {}
         try:
-            # Use CoinGecko's free API with proper coin IDs
-            coin_mapping = {
-                'BTC': 'bitcoin',
-                'ETH': 'ethereum', 
-                'ADA': 'cardano',
-                'DOT': 'polkadot',
-                'LINK': 'chainlink',
-                'UNI': 'uniswap',
-                'AAVE': 'aave',
-                'SOL': 'solana',
-                'MATIC': 'matic-network',
-                'AVAX': 'avalanche-2'
-            }
-            
-            # Get all prices in one request
+            # Use CoinGecko's free API with proper coin IDs, all in one request
             coin_ids = []
             for symbol in symbols:
-                if symbol in coin_mapping:
-                    coin_ids.append(coin_mapping[symbol])
-            
+                if symbol in COIN_MAPPING:
+                    coin_ids.append(COIN_MAPPING[symbol])
+
             if coin_ids:
                 url = f"https://api.coingecko.com/api/v3/simple/price?ids={','.join(coin_ids)}&vs_currencies=usd"
-                response = requests.get(url, timeout=10)
+                response = self.session.get(url, timeout=HTTP_TIMEOUT)
                 if response.status_code == 200:
                     data = response.json()
                     for symbol in symbols:
-                        if symbol in coin_mapping and coin_mapping[symbol] in data:
-                            prices[symbol] = data[coin_mapping[symbol]]['usd']
+                        if symbol in COIN_MAPPING and COIN_MAPPING[symbol] in data:
+                            prices[symbol] = data[COIN_MAPPING[symbol]]['usd']
         except Exception as e:
             app.logger.error(f"Error with free API: {e}")
             # Return mock prices if API fails
@@ -283,11 +518,49 @@ class CryptoService:
                     prices[symbol] = mock_prices[symbol]
         return prices
 
+    def get_chart_data(self, symbol, days):
+        """Get historical chart data for a symbol from CoinGecko"""
+        cache_key = (symbol, days)
+        with self._cache_lock:
+            if cache_key in self._chart_cache:
+                return self._chart_cache[cache_key]
+
+        coin_id = COIN_MAPPING.get(symbol)
+        if not coin_id:
+            return None
+
+        url = f'https://api.coingecko.com/api/v3/coins/{coin_id}/market_chart'
+        params = {
+            'vs_currency': 'usd',
+            'days': days
+        }
+
+        response = self.session.get(url, params=params, timeout=HTTP_TIMEOUT, headers={
+            'Accept': 'application/json',
+            'User-Agent': 'Crypto-Price-Alert-Assistant/1.0'
+        })
+        if response.status_code == 429:
+            raise UpstreamRateLimited(response.headers.get('Retry-After'))
+        response.raise_for_status()
+        data = response.json()
+
+        chart_data = {
+            'prices': data.get('prices', []),
+            'volumes': data.get('total_volumes', [])
+        }
+
+        with self._cache_lock:
+            self._chart_cache[cache_key] = chart_data
+
+        return chart_data
+
 # Telegram Service
 class TelegramService:
     def __init__(self):
         self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
-        
+        self.session = build_http_session()
+
+
     def send_message(self, chat_id, message):
         """Send message via Telegram bot"""
         if not self.bot_token or self.bot_token == 'your-telegram-bot-token':
@@ -303,7 +576,7 @@ class TelegramService:
                 'parse_mode': 'HTML'
             }
             
-            response = requests.post(url, data=data, timeout=10)
+            response = self.session.post(url, data=data, timeout=HTTP_TIMEOUT)
             response.raise_for_status()
             return True
             
@@ -311,9 +584,65 @@ class TelegramService:
             app.logger.error(f"Error sending Telegram message: {e}")
             return False
 
+    def send_messages(self, messages):
+        """Send many (chat_id, message) pairs concurrently.
+
+        With httpx installed the sends share one keep-alive client and
+        run under asyncio.gather; otherwise they fan out on the thread
+        pool. Returns a list of success flags aligned with messages.
+        """
+        if not messages:
+            return []
+
+        if httpx is None or not self.bot_token or self.bot_token == 'your-telegram-bot-token':
+            futures = [
+                telegram_pool.submit(self.send_message, chat_id, message)
+                for chat_id, message in messages
+            ]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result(timeout=15))
+                except Exception as e:
+                    app.logger.error(f"Error sending Telegram message: {e}")
+                    results.append(False)
+            return results
+
+        # The scheduler thread has no running event loop, so asyncio.run
+        # gives the gather its own
+        return asyncio.run(self._send_messages_async(messages))
+
+    async def _send_messages_async(self, messages):
+        url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
+        limits = httpx.Limits(max_keepalive_connections=20)
+        async with httpx.AsyncClient(timeout=10, limits=limits) as client:
+            async def send_one(chat_id, message):
+                try:
+                    response = await client.post(url, data={
+                        'chat_id': chat_id,
+                        'text': message,
+                        'parse_mode': 'HTML'
+                    })
+                    response.raise_for_status()
+                    return True
+                except Exception as e:
+                    app.logger.error(f"Error sending Telegram message: {e}")
+                    return False
+
+            return await asyncio.gather(
+                *(send_one(chat_id, message) for chat_id, message in messages)
+            )
+
 # Initialize services
 crypto_service = CryptoService()
 telegram_service = TelegramService()
+atexit.register(crypto_service.session.close)
+atexit.register(telegram_service.session.close)
+
+# Telegram sends run off the scheduler thread so one slow chat doesn't
+# stall the whole alert-check tick
+telegram_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='telegram-send')
+atexit.register(telegram_pool.shutdown)
 
 # API Routes
 @app.route('/api/health', methods=['GET'])
@@ -321,23 +650,30 @@ def health_check():
     """Health check endpoint"""
     return jsonify({'status': 'healthy', 'timestamp': datetime.now(timezone.utc).isoformat()})
 
+# Constant payload: serialize once at import time and let clients
+# revalidate with If-None-Match instead of re-downloading it
+POPULAR_CRYPTOS = [
+    {'symbol': 'BTC', 'name': 'Bitcoin'},
+    {'symbol': 'ETH', 'name': 'Ethereum'},
+    {'symbol': 'ADA', 'name': 'Cardano'},
+    {'symbol': 'DOT', 'name': 'Polkadot'},
+    {'symbol': 'LINK', 'name': 'Chainlink'},
+    {'symbol': 'UNI', 'name': 'Uniswap'},
+    {'symbol': 'AAVE', 'name': 'Aave'},
+    {'symbol': 'SOL', 'name': 'Solana'},
+    {'symbol': 'MATIC', 'name': 'Polygon'},
+    {'symbol': 'AVAX', 'name': 'Avalanche'}
+]
+_CRYPTOS_JSON = orjson.dumps(POPULAR_CRYPTOS)
+_CRYPTOS_ETAG = hashlib.md5(_CRYPTOS_JSON).hexdigest()
+
 @app.route('/api/cryptos', methods=['GET'])
 @rate_limit
 def get_cryptos():
     """Get list of popular cryptocurrencies"""
-    popular_cryptos = [
-        {'symbol': 'BTC', 'name': 'Bitcoin'},
-        {'symbol': 'ETH', 'name': 'Ethereum'},
-        {'symbol': 'ADA', 'name': 'Cardano'},
-        {'symbol': 'DOT', 'name': 'Polkadot'},
-        {'symbol': 'LINK', 'name': 'Chainlink'},
-        {'symbol': 'UNI', 'name': 'Uniswap'},
-        {'symbol': 'AAVE', 'name': 'Aave'},
-        {'symbol': 'SOL', 'name': 'Solana'},
-        {'symbol': 'MATIC', 'name': 'Polygon'},
-        {'symbol': 'AVAX', 'name': 'Avalanche'}
-    ]
-    return jsonify(popular_cryptos)
+    response = Response(_CRYPTOS_JSON, mimetype='application/json')
+    response.set_etag(_CRYPTOS_ETAG)
+    return response.make_conditional(request)
 
 @app.route('/api/prices', methods=['GET'])
 @rate_limit
@@ -363,13 +699,16 @@ def get_prices():
 def get_alerts():
     """Get all alerts for the authenticated user"""
     try:
-        user = User.query.get(request.current_user_id)
-        if not user or not user.telegram_chat_id:
-            return jsonify({'error': 'Telegram chat ID not configured'}), 400
-        
-        alerts = Alert.query.filter_by(telegram_chat_id=user.telegram_chat_id, is_active=True).all()
-        return jsonify([alert.to_dict() for alert in alerts])
-        
+        with reader_session() as session:
+            user = session.get(User, request.current_user_id)
+            if not user or not user.telegram_chat_id:
+                return jsonify({'error': 'Telegram chat ID not configured'}), 400
+
+            alerts = session.query(Alert).filter_by(
+                telegram_chat_id=user.telegram_chat_id, is_active=True
+            ).all()
+            return jsonify([alert.to_dict() for alert in alerts])
+
     except Exception as e:
         app.logger.error(f"Get alerts error: {str(e)}")
         return jsonify({'error': 'Failed to get alerts'}), 500
@@ -506,46 +845,45 @@ def get_chart_data():
     try:
         symbol = request.args.get('symbol', 'BTC').upper()
         days = request.args.get('days', '1')
-        
-        # CoinGecko API mapping
-        coin_mapping = {
-            'BTC': 'bitcoin',
-            'ETH': 'ethereum',
-            'ADA': 'cardano',
-            'DOT': 'polkadot',
-            'LINK': 'chainlink',
-            'UNI': 'uniswap',
-            'AAVE': 'aave',
-            'SOL': 'solana',
-            'MATIC': 'matic-network',
-            'AVAX': 'avalanche-2'
-        }
-        
-        coin_id = coin_mapping.get(symbol)
-        if not coin_id:
+
+        # Serve from Redis when available so all workers share one copy;
+        # long ranges barely change, so they get a longer TTL
+        cache_key = f'chart:{symbol}:{days}'
+        try:
+            cached = redis_client.get(cache_key)
+        except redis.RedisError:
+            cached = None
+        if cached:
+            return Response(cached, mimetype='application/json')
+
+        chart_data = crypto_service.get_chart_data(symbol, days)
+        if chart_data is None:
             return jsonify({'error': f'Unsupported cryptocurrency: {symbol}'}), 400
-        
-        # Fetch data from CoinGecko API
-        url = f'https://api.coingecko.com/api/v3/coins/{coin_id}/market_chart'
-        params = {
-            'vs_currency': 'usd',
-            'days': days
-        }
-        
-        response = requests.get(url, params=params, headers={
-            'Accept': 'application/json',
-            'User-Agent': 'Crypto-Price-Alert-Assistant/1.0'
-        })
-        
-        if response.status_code == 200:
-            data = response.json()
-            return jsonify({
-                'prices': data.get('prices', []),
-                'volumes': data.get('total_volumes', [])
-            })
-        else:
-            return jsonify({'error': f'CoinGecko API error: {response.status_code}'}), 500
-            
+
+        body = orjson.dumps(chart_data)
+        try:
+            days_int = int(days)
+        except ValueError:
+            days_int = 365  # 'max' and friends
+        try:
+            redis_client.setex(cache_key, 3600 if days_int > 30 else 60, body)
+        except redis.RedisError:
+            pass
+
+        return Response(body, mimetype='application/json')
+
+    except UpstreamRateLimited as e:
+        # CoinGecko answered 429; pass its Retry-After through to the client
+        response = jsonify({'error': 'CoinGecko rate limit reached, please retry later'})
+        response.status_code = 503
+        response.headers['Retry-After'] = e.retry_after or '60'
+        return response
+    except requests.exceptions.RetryError:
+        # The bounded 5xx retries were exhausted; suggest a default back-off
+        response = jsonify({'error': 'CoinGecko is unavailable, please retry later'})
+        response.status_code = 503
+        response.headers['Retry-After'] = '60'
+        return response
     except Exception as e:
         app.logger.error(f"Chart data error: {str(e)}")
         return jsonify({'error': 'Failed to fetch chart data'}), 500
@@ -713,72 +1051,186 @@ def update_telegram_chat_id():
         db.session.rollback()
         return jsonify({'error': 'Failed to update Telegram chat ID'}), 500
 
+# Static notification template; only the dynamic fields are formatted
+# per triggered alert
+ALERT_MESSAGE_TEMPLATE = (
+    "🚨 <b>Price Alert!</b>\n\n"
+    "💰 {symbol} is now ${price:.2f}\n"
+    "📊 This is {direction} your threshold of ${threshold:.2f}{price_change}\n\n"
+    "⏰ Alert triggered at {timestamp} UTC"
+)
+
 # Background task for monitoring prices
+_CHECK_ALERTS_LOCK_KEY = 'lock:check_alerts'
+# Must outlast the worst-case tick (upstream fetch with retries plus the
+# Telegram fan-out can run well past the 10s interval); the holder
+# releases explicitly, so the TTL only matters if it crashes
+_CHECK_ALERTS_LOCK_TTL = 120
+# Atomic compare-and-delete: only the holder's token may release
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
 def check_alerts():
     """Check all active alerts and send notifications"""
+    # Cross-instance coordination: when several schedulers run (multiple
+    # gunicorn workers or app instances), only the one that wins the
+    # Redis lock performs the tick. The lock is held until the tick's
+    # commit and then released by token, so a tick that outlasts the
+    # 10s interval can't overlap with another instance's; the TTL is a
+    # backstop against a crashed holder. Without Redis we assume a
+    # single-scheduler deployment and proceed.
+    lock_token = uuid4().hex
+    try:
+        got_lock = redis_client.set(
+            _CHECK_ALERTS_LOCK_KEY, lock_token,
+            nx=True, ex=_CHECK_ALERTS_LOCK_TTL
+        )
+    except redis.RedisError:
+        lock_token = None
+        got_lock = True
+    if not got_lock:
+        return
+
+    try:
+        _check_alerts_tick()
+    finally:
+        if lock_token is not None:
+            try:
+                redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, _CHECK_ALERTS_LOCK_KEY, lock_token)
+            except redis.RedisError:
+                pass
+
+def _check_alerts_tick():
     with app.app_context():
-        active_alerts = Alert.query.filter_by(is_active=True).all()
-        
-        if not active_alerts:
+        # Let SQLite dedupe the symbols instead of materializing every
+        # alert row just to build the set in Python
+        with reader_session() as session:
+            symbols_to_check = [
+                row[0] for row in
+                session.query(Alert.crypto_symbol)
+                .filter(Alert.is_active.is_(True))
+                .distinct()
+            ]
+
+        if not symbols_to_check:
             return
-        
-        # Group alerts by crypto symbol for efficient API calls
-        symbols_to_check = list(set([alert.crypto_symbol for alert in active_alerts]))
+
         current_prices = crypto_service.get_crypto_prices(symbols_to_check)
-        
+        if not current_prices:
+            return
+
+        # Only pull alerts whose symbol the API actually returned, and
+        # stream them in chunks of plain column tuples rather than
+        # materializing every ORM row at once
+        active_alerts = (
+            db.session.query(
+                Alert.id,
+                Alert.crypto_symbol,
+                Alert.threshold_price,
+                Alert.last_checked_price,
+                Alert.is_above,
+                Alert.telegram_chat_id
+            )
+            .filter(
+                Alert.is_active.is_(True),
+                Alert.crypto_symbol.in_(current_prices.keys())
+            )
+            .execution_options(stream_results=True)
+            .yield_per(500)
+        )
+
+        # Group once by symbol so the inner loop walks each symbol's
+        # alerts with the price held in a local, instead of paying a dict
+        # lookup per alert
+        by_symbol = defaultdict(list)
         for alert in active_alerts:
-            if alert.crypto_symbol not in current_prices:
-                continue
-                
-            current_price = current_prices[alert.crypto_symbol]
-            threshold = alert.threshold_price
-            last_price = alert.last_checked_price
-            
-            # Check if alert should trigger (detect actual crossing)
-            should_trigger = False
-            
-            if alert.is_above:
-                # Alert when price goes above threshold
-                if current_price >= threshold and (last_price is None or last_price < threshold):
-                    should_trigger = True
-            else:
-                # Alert when price goes below threshold
-                if current_price <= threshold and (last_price is None or last_price > threshold):
-                    should_trigger = True
-            
-            # Update last checked price
-            alert.last_checked_price = current_price
-            
-            if should_trigger:
-                # Send notification
-                direction = "above" if alert.is_above else "below"
-                price_change = ""
-                if last_price:
-                    change = current_price - last_price
-                    change_pct = (change / last_price) * 100
-                    price_change = f"\n📈 Price change: ${change:.2f} ({change_pct:+.2f}%)"
-                
-                message = f"🚨 <b>Price Alert!</b>\n\n"
-                message += f"💰 {alert.crypto_symbol} is now ${current_price:.2f}\n"
-                message += f"📊 This is {direction} your threshold of ${threshold:.2f}{price_change}\n\n"
-                message += f"⏰ Alert triggered at {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC"
-                
-                # Always mark alert as triggered when price crosses threshold
-                alert.triggered_at = datetime.now(timezone.utc)
-                alert.is_active = False  # Deactivate after triggering
-                
-                # Try to send Telegram message
-                telegram_success = telegram_service.send_message(alert.telegram_chat_id, message)
-                
-                if telegram_success:
-                    app.logger.info(f"Alert triggered for {alert.crypto_symbol} - Price crossed threshold! Telegram sent.")
+            by_symbol[alert.crypto_symbol].append(alert)
+
+        # One timestamp per tick; every alert in this pass triggers at
+        # the same moment anyway
+        tick_time = datetime.now(timezone.utc)
+        tick_timestamp = tick_time.strftime('%Y-%m-%d %H:%M:%S')
+
+        pending_sends = []  # (symbol, chat_id, message)
+        price_updates = {}  # alert id -> new last_checked_price
+        triggered_ids = []
+        for symbol, current_price in current_prices.items():
+            for alert in by_symbol.get(symbol, ()):
+                threshold = alert.threshold_price
+                last_price = alert.last_checked_price
+
+                # Check if alert should trigger (detect actual crossing)
+                should_trigger = False
+
+                if alert.is_above:
+                    # Alert when price goes above threshold
+                    if current_price >= threshold and (last_price is None or last_price < threshold):
+                        should_trigger = True
                 else:
-                    app.logger.warning(f"Alert triggered for {alert.crypto_symbol} - Price crossed threshold! Telegram failed.")
-                
-                db.session.commit()
+                    # Alert when price goes below threshold
+                    if current_price <= threshold and (last_price is None or last_price > threshold):
+                        should_trigger = True
+
+                # Update last checked price
+                price_updates[alert.id] = current_price
+
+                if should_trigger:
+                    # Send notification
+                    direction = "above" if alert.is_above else "below"
+                    price_change = ""
+                    if last_price:
+                        change = current_price - last_price
+                        change_pct = (change / last_price) * 100
+                        price_change = f"\n📈 Price change: ${change:.2f} ({change_pct:+.2f}%)"
+
+                    message = ALERT_MESSAGE_TEMPLATE.format(
+                        symbol=symbol,
+                        price=current_price,
+                        direction=direction,
+                        threshold=threshold,
+                        price_change=price_change,
+                        timestamp=tick_timestamp
+                    )
+
+                    # Always mark alert as triggered when price crosses threshold
+                    triggered_ids.append(alert.id)
+
+                    # Queue the notification; all sends go out together below
+                    pending_sends.append((symbol, alert.telegram_chat_id, message))
+
+        results = telegram_service.send_messages(
+            [(chat_id, message) for _, chat_id, message in pending_sends]
+        )
+        for (symbol, _, _), telegram_success in zip(pending_sends, results):
+            if telegram_success:
+                app.logger.info(f"Alert triggered for {symbol} - Price crossed threshold! Telegram sent.")
             else:
-                # Just update the last price without triggering
-                db.session.commit()
+                app.logger.warning(f"Alert triggered for {symbol} - Price crossed threshold! Telegram failed.")
+
+        # One commit for the whole tick: a single CASE-dispatched UPDATE
+        # covers every price change and one more deactivates triggered
+        # alerts, instead of M per-row ORM flushes
+        try:
+            if price_updates:
+                db.session.execute(
+                    update(Alert)
+                    .where(Alert.id.in_(price_updates))
+                    .values(last_checked_price=case(price_updates, value=Alert.id))
+                )
+            if triggered_ids:
+                db.session.execute(
+                    update(Alert)
+                    .where(Alert.id.in_(triggered_ids))
+                    .values(is_active=False, triggered_at=tick_time)
+                )
+            db.session.commit()
+        except Exception as e:
+            app.logger.error(f"Failed to commit alert check updates: {e}")
+            db.session.rollback()
 
 # Initialize scheduler
 scheduler = BackgroundScheduler()
@@ -787,21 +1239,34 @@ scheduler.add_job(
     trigger=IntervalTrigger(seconds=10),  # Check every 10 seconds for faster alerts
     id='check_alerts',
     name='Check cryptocurrency price alerts',
-    replace_existing=True
+    replace_existing=True,
+    coalesce=True,  # collapse missed runs into one
+    max_instances=1,  # never overlap a slow tick with the next one
+    misfire_grace_time=5
 )
 
-if __name__ == '__main__':
-    # Create database tables
+def init_db():
+    """Create tables and make sure the Alert indexes exist"""
     with app.app_context():
         db.create_all()
-    
-    # Start scheduler
-    scheduler.start()
-    
+        # create_all skips tables that already exist, so make sure the
+        # Alert indexes land on databases created before they were added
+        for index in Alert.__table__.indexes:
+            index.create(bind=db.engine, checkfirst=True)
+
+def start_scheduler():
+    if not scheduler.running:
+        scheduler.start()
+
+if __name__ == '__main__':
+    # Dev entry point; production runs under gunicorn via wsgi.py
+    init_db()
+    start_scheduler()
+
     # Configure logging
     logging.basicConfig(level=logging.INFO)
-    
+
     try:
-        app.run(debug=True, host='0.0.0.0', port=5000)
+        app.run(debug=os.getenv('FLASK_DEBUG', '1') == '1', host='0.0.0.0', port=5000)
     except KeyboardInterrupt:
         scheduler.shutdown()
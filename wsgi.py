@@ -0,0 +1,29 @@
+"""WSGI entry point for production servers.
+
+Run with a prefork server instead of the single-threaded dev server:
+
+    gunicorn -k gthread -w $(nproc) --threads 8 --timeout 30 wsgi:app
+
+The alert scheduler must only run once, so each worker races on a
+non-blocking file lock and the winner starts it; the others serve
+requests only.
+"""
+
+import fcntl
+import logging
+
+from app import app, init_db, start_scheduler
+
+logging.basicConfig(level=logging.INFO)
+
+init_db()
+
+# Held for the worker's lifetime; releasing it (worker exit) lets a
+# replacement worker take over the scheduler
+_scheduler_lock = open('/tmp/crypto_alerts_scheduler.lock', 'w')
+try:
+    fcntl.flock(_scheduler_lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    start_scheduler()
+    app.logger.info('Alert scheduler started in this worker')
+except OSError:
+    app.logger.info('Alert scheduler already running in another worker')